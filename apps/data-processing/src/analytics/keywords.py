@@ -3,10 +3,33 @@ Keyword extraction module for analytics.
 
 Extracts key entities (coins, protocols, people) from news content
 to tag and filter analytics.
+
+The module is fully annotated so it can be compiled ahead of time by
+running ``mypyc --explicit-package-bases src/analytics/keywords.py`` from
+``apps/data-processing``; the resulting extension modules are picked up in
+place of this file without any import changes.
 """
 
 import re
-from typing import List, Set
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+try:
+    import hyperscan
+
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 # Static dictionary of known crypto projects and their tickers
 CRYPTO_PROJECT_MAP: dict[str, List[str]] = {
@@ -202,6 +225,179 @@ TICKER_EXCLUSIONS: Set[str] = {
     "NODES",
 }
 
+# Intern every keyword string so set/dict operations on them, here and in
+# downstream consumers, can compare by identity and reuse cached hashes
+CRYPTO_PROJECT_MAP = {
+    sys.intern(name): [sys.intern(value) for value in values]
+    for name, values in CRYPTO_PROJECT_MAP.items()
+}
+KNOWN_TICKERS = {sys.intern(ticker) for ticker in KNOWN_TICKERS}
+TICKER_TO_PROJECT = {
+    sys.intern(ticker): [sys.intern(project) for project in projects]
+    for ticker, projects in TICKER_TO_PROJECT.items()
+}
+TICKER_EXCLUSIONS = {sys.intern(word) for word in TICKER_EXCLUSIONS}
+
+# Project names are embedded in regex and Hyperscan patterns without escaping
+assert all(
+    re.fullmatch(r"[a-z0-9 ]+", name) for name in CRYPTO_PROJECT_MAP
+), "CRYPTO_PROJECT_MAP keys must only contain lowercase letters, digits and spaces"
+
+# Single-probe table for ticker candidates: every known ticker that is not an
+# excluded word maps to itself plus its project names, anything else is absent
+TICKER_EXPANSION: Dict[str, FrozenSet[str]] = {
+    ticker: frozenset([ticker, *TICKER_TO_PROJECT.get(ticker, ())])
+    for ticker in KNOWN_TICKERS - TICKER_EXCLUSIONS
+}
+
+# Minimum batch size to justify spawning worker threads
+_PARALLEL_THRESHOLD = 20
+
+# Number of distinct texts whose extract_set() results are memoized per extractor
+_EXTRACT_CACHE_SIZE = 4096
+
+# Longest text whose extract_set() result is memoized; longer texts such as
+# article bodies are rarely repeated and would pin whole documents in memory
+_CACHED_TEXT_MAX_LENGTH = 512
+
+# Text length from which extract_tickers_only() finds uppercase runs with
+# NumPy instead of the ticker regex; on ticker-dense text NumPy only wins
+# consistently from about this length
+_VECTORIZED_TICKER_MIN_LENGTH = 8192
+
+
+def _is_word_char(char: str) -> bool:
+    """Return True if ``char`` counts as a word character for regex ``\\b``."""
+    return char.isalnum() or char == "_"
+
+
+def _has_unicode_word_neighbour(data: bytes, start: int, end: int) -> bool:
+    """
+    Check whether a UTF-8 match is adjacent to a non-ASCII word character.
+
+    Hyperscan evaluates ``\\b`` on ASCII only, so a match next to a letter
+    such as "é" has to be rejected here to keep ``re`` semantics.
+    """
+    if start > 0 and data[start - 1] >= 0x80:
+        lead = start - 1
+        while data[lead] & 0xC0 == 0x80:
+            lead -= 1
+        if _is_word_char(data[lead:start].decode("utf-8", "surrogatepass")):
+            return True
+    if end < len(data) and data[end] >= 0x80:
+        tail = end + 1
+        while tail < len(data) and data[tail] & 0xC0 == 0x80:
+            tail += 1
+        if _is_word_char(data[end:tail].decode("utf-8", "surrogatepass")):
+            return True
+    return False
+
+
+def _find_uppercase_runs(text: str) -> List[str]:
+    """
+    Find ``\\b[A-Z]{2,5}\\b`` tokens using vectorized NumPy operations.
+
+    Code points are compared against "A".."Z" in bulk and run edges located
+    with ``np.diff``; only runs of 2-5 letters get a Python-level word
+    boundary check. Matches the ticker regex's findall() output.
+
+    Args:
+        text: The text to scan.
+
+    Returns:
+        The matching tokens in text order.
+    """
+    # Imported here so only long-text ticker scans pay NumPy's import cost
+    import numpy as np
+
+    codes = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    is_upper = (codes >= 65) & (codes <= 90)
+    edges = np.flatnonzero(np.diff(is_upper, prepend=False, append=False))
+    starts = edges[0::2]
+    ends = edges[1::2]
+    lengths = ends - starts
+    keep = (lengths >= 2) & (lengths <= 5)
+
+    length = len(text)
+    runs: List[str] = []
+    for start, end in zip(starts[keep].tolist(), ends[keep].tolist()):
+        if (start > 0 and _is_word_char(text[start - 1])) or (
+            end < length and _is_word_char(text[end])
+        ):
+            continue
+        runs.append(text[start:end])
+    return runs
+
+
+def _trie_regex(words: List[str]) -> str:
+    """
+    Build a regex alternation of ``words`` in prefix-trie form.
+
+    Shared prefixes are matched once and longer words are tried first, e.g.
+    ``["sol", "solana", "stellar"]`` becomes ``s(?:ol(?:ana)?|tellar)``.
+
+    Args:
+        words: The literal words to match; they are not escaped, so they must
+            not contain regex metacharacters.
+
+    Returns:
+        A regex pattern matching any of the words, longest first.
+    """
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        # Empty key marks the end of a word
+        node[""] = {}
+    return _trie_node_regex(trie)
+
+
+def _trie_node_regex(node: Dict[str, Any]) -> str:
+    """Emit the regex for a trie node built by ``_trie_regex``."""
+    branches = [
+        char + _trie_node_regex(child) for char, child in sorted(node.items()) if char
+    ]
+    if not branches:
+        return ""
+    if len(branches) == 1 and "" not in node:
+        return branches[0]
+    pattern = "(?:" + "|".join(branches) + ")"
+    # A word ending here makes the longer continuations optional; the greedy
+    # "?" still tries them first, like a longest-first alternation
+    return pattern + "?" if "" in node else pattern
+
+
+def _collect_hyperscan_match(
+    match_id: int, start: int, end: int, flags: int, context: Any
+) -> None:
+    """Hyperscan match callback appending each match to the context list."""
+    context.append((match_id, start, end))
+
+
+def _select_longest(project_hits: List[Tuple[int, int, str]]) -> List[str]:
+    """
+    Keep leftmost-longest, non-overlapping project matches.
+
+    This mirrors the longest-first alternation of the project regex for
+    scanners that report every (possibly overlapping) match.
+
+    Args:
+        project_hits: (start, exclusive end, project name) tuples.
+
+    Returns:
+        The selected project names in text order.
+    """
+    project_matches: List[str] = []
+    last_end = 0
+    for start, end, project_name in sorted(
+        project_hits, key=lambda hit: (hit[0], -hit[1])
+    ):
+        if start >= last_end:
+            project_matches.append(project_name)
+            last_end = end
+    return project_matches
+
 
 class KeywordExtractor:
     """
@@ -209,18 +405,234 @@ class KeywordExtractor:
     to tag and filter analytics.
     """
 
-    def __init__(self):
+    # Slots avoid a per-instance __dict__ and make attribute reads in the hot
+    # extraction paths plain slot loads
+    __slots__ = (
+        "ticker_regex",
+        "project_names",
+        "_project_pattern",
+        "_combined_pattern",
+        "_ticker_expansion",
+        "_scan_tickers",
+        "_keyword_chars",
+        "_hyperscan_ids",
+        "_hyperscan_db",
+        "_hyperscan_local",
+        "_automaton",
+        "_cached_extract",
+    )
+
+    def __init__(self) -> None:
         """Initialize the keyword extractor with regex patterns."""
         self.ticker_regex = re.compile(TICKER_PATTERN)
         # Create a sorted list of project names for longest-match-first matching
         self.project_names = sorted(CRYPTO_PROJECT_MAP.keys(), key=len, reverse=True)
-        # Compile regex for project name matching (case insensitive)
-        self._project_pattern = re.compile(
-            r"\b(" + "|".join(re.escape(name) for name in self.project_names) + r")\b",
-            re.IGNORECASE,
+        # Project names as a prefix trie, so shared prefixes are matched once
+        project_regex = _trie_regex(self.project_names)
+        # Compile regex for project name matching; names are lowercase, so it
+        # runs against lowercased text instead of using re.IGNORECASE
+        self._project_pattern = re.compile(r"\b(" + project_regex + r")\b")
+        # Combined project/ticker regex so the fallback scan walks the text once;
+        # only the project group is case insensitive
+        self._combined_pattern = re.compile(
+            r"\b(?P<proj>(?i:" + project_regex + r"))\b|(?P<tk>" + TICKER_PATTERN + ")"
+        )
+        self._ticker_expansion = TICKER_EXPANSION
+        # Tickers that can actually be reported by the ticker pattern
+        self._scan_tickers = sorted(
+            ticker for ticker in TICKER_EXPANSION if self.ticker_regex.fullmatch(ticker)
+        )
+        # Characters that can start a keyword; extract_set() skips any text that
+        # contains none of them
+        self._keyword_chars = frozenset(
+            [name[0] for name in self.project_names]
+            + [name[0].upper() for name in self.project_names]
+            + [ticker[0] for ticker in self._scan_tickers]
+        )
+        # Single-pass multi-pattern scanners used by extract_set(), preferring
+        # Hyperscan, then pyahocorasick, then the combined regex
+        self._hyperscan_ids: List[Tuple[Optional[str], Optional[str]]] = []
+        self._hyperscan_db: Optional["hyperscan.Database"] = None
+        # Hyperscan scratch space cannot be shared by concurrent scans
+        self._hyperscan_local = threading.local()
+        self._automaton: Optional["ahocorasick.Automaton"] = None
+        # Memoized extract_set() for headline-sized texts; retries and dedup
+        # passes often rescan the same headline
+        self._cached_extract = lru_cache(maxsize=_EXTRACT_CACHE_SIZE)(
+            self._extract_keywords
+        )
+        if HYPERSCAN_AVAILABLE:
+            self._hyperscan_db = self._build_hyperscan_db()
+        elif AHOCORASICK_AVAILABLE:
+            self._automaton = self._build_automaton()
+
+    def _build_hyperscan_db(self) -> "hyperscan.Database":
+        """
+        Compile project names and tickers into one Hyperscan block database.
+
+        Pattern ids index ``self._hyperscan_ids``, which holds the matching
+        ``(project_name, ticker)`` pair with the other side set to None.
+        """
+        expressions: List[bytes] = []
+        flags: List[int] = []
+        for name in self.project_names:
+            expressions.append(rf"\b{name}\b".encode())
+            flags.append(hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_CASELESS)
+            self._hyperscan_ids.append((name, None))
+        for ticker in self._scan_tickers:
+            expressions.append(rf"\b{ticker}\b".encode())
+            flags.append(hyperscan.HS_FLAG_SOM_LEFTMOST)
+            self._hyperscan_ids.append((None, ticker))
+
+        database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        database.compile(
+            expressions=expressions,
+            ids=list(range(len(expressions))),
+            flags=flags,
         )
+        return database
+
+    def _build_automaton(self) -> "ahocorasick.Automaton":
+        """
+        Build an automaton matching lowercased project names and tickers.
+
+        Each entry maps to a ``(project_name, ticker)`` pair, either of which
+        may be None, since some words ("xlm", "btc", ...) are both.
+        """
+        entries: dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        for name in self.project_names:
+            entries[name] = (name, None)
+        for ticker in self._scan_tickers:
+            project_name = entries.get(ticker.lower(), (None, None))[0]
+            entries[ticker.lower()] = (project_name, ticker)
+
+        automaton = ahocorasick.Automaton()
+        for word, value in entries.items():
+            automaton.add_word(word, value)
+        automaton.make_automaton()
+        return automaton
 
-    def extract(self, text: str) -> List[str]:
+    def _scan(self, text: str) -> Tuple[List[str], List[str]]:
+        """
+        Find project name and ticker matches in the given text.
+
+        Uses Hyperscan or the Aho-Corasick automaton when available, falling
+        back to the combined project/ticker regex otherwise.
+
+        Args:
+            text: The text to scan.
+
+        Returns:
+            A tuple of (project name matches, ticker matches).
+        """
+        hyperscan_db = self._hyperscan_db
+        if hyperscan_db is not None:
+            return self._scan_hyperscan(text, hyperscan_db)
+        automaton = self._automaton
+        if automaton is not None:
+            return self._scan_automaton(text, automaton)
+        return self._scan_regex(text)
+
+    def _scan_hyperscan(
+        self, text: str, database: "hyperscan.Database"
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Find project name and ticker matches with a single Hyperscan pass.
+
+        Args:
+            text: The text to scan.
+            database: The compiled Hyperscan database.
+
+        Returns:
+            A tuple of (project name matches, ticker matches).
+        """
+        data = text.encode("utf-8", "surrogatepass")
+        scratch = getattr(self._hyperscan_local, "scratch", None)
+        if scratch is None:
+            scratch = hyperscan.Scratch(database)
+            self._hyperscan_local.scratch = scratch
+
+        hits: List[Tuple[int, int, int]] = []
+        database.scan(
+            data,
+            match_event_handler=_collect_hyperscan_match,
+            context=hits,
+            scratch=scratch,
+        )
+
+        project_hits: List[Tuple[int, int, str]] = []
+        ticker_matches: List[str] = []
+        for match_id, start, end in hits:
+            if _has_unicode_word_neighbour(data, start, end):
+                continue
+            project_name, ticker = self._hyperscan_ids[match_id]
+            if project_name is not None:
+                project_hits.append((start, end, project_name))
+            elif ticker is not None:
+                ticker_matches.append(ticker)
+
+        return _select_longest(project_hits), ticker_matches
+
+    def _scan_automaton(
+        self, text: str, automaton: "ahocorasick.Automaton"
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Find project name and ticker matches with a single automaton pass.
+
+        Args:
+            text: The text to scan.
+            automaton: The Aho-Corasick automaton.
+
+        Returns:
+            A tuple of (project name matches, ticker matches).
+        """
+        lowered = text.lower()
+        # Offsets in the lowercased text only line up with the original text
+        # when lowercasing preserved its length
+        if len(lowered) != len(text):
+            return self._scan_regex(text)
+
+        length = len(text)
+        project_hits: List[Tuple[int, int, str]] = []
+        ticker_matches: List[str] = []
+        for end, (project_name, ticker) in automaton.iter(lowered):
+            start = end - len(project_name or ticker) + 1
+            if (start > 0 and _is_word_char(lowered[start - 1])) or (
+                end + 1 < length and _is_word_char(lowered[end + 1])
+            ):
+                continue
+            if project_name is not None:
+                project_hits.append((start, end + 1, project_name))
+            if ticker is not None and text[start : end + 1] == ticker:
+                ticker_matches.append(ticker)
+
+        return _select_longest(project_hits), ticker_matches
+
+    def _scan_regex(self, text: str) -> Tuple[List[str], List[str]]:
+        """
+        Find project name and ticker matches with a single combined regex pass.
+
+        Args:
+            text: The text to scan.
+
+        Returns:
+            A tuple of (project name matches, ticker matches).
+        """
+        project_matches: List[str] = []
+        ticker_matches: List[str] = []
+        for match in self._combined_pattern.finditer(text):
+            value = match.group()
+            if match.lastgroup == "proj":
+                project_matches.append(value)
+                # An uppercase project name such as "XRP" is a ticker as well
+                if not value.islower():
+                    ticker_matches.extend(self.ticker_regex.findall(value))
+            else:
+                ticker_matches.append(value)
+
+        return project_matches, ticker_matches
+
+    def extract(self, text: Optional[str]) -> List[str]:
         """
         Extract key entities from the given text.
 
@@ -228,39 +640,100 @@ class KeywordExtractor:
             text: The text to extract keywords from.
 
         Returns:
-            A list of unique extracted keywords (tickers and project names).
+            A sorted list of unique extracted keywords (tickers and project
+            names).
+        """
+        # Sorted list for consistent output
+        return sorted(self.extract_set(text))
+
+    def extract_set(self, text: Optional[str]) -> FrozenSet[str]:
+        """
+        Extract key entities from the given text as an unordered set.
+
+        Prefer this over extract() when the result is only used for
+        membership tests or set operations, as it skips sorting and copying.
+
+        Args:
+            text: The text to extract keywords from.
+
+        Returns:
+            A frozenset of extracted keywords (tickers and project names).
         """
         if not text or not isinstance(text, str):
-            return []
+            return frozenset()
+
+        # Cheap C-level bailout for texts that cannot contain any keyword
+        if self._keyword_chars.isdisjoint(text):
+            return frozenset()
+
+        if len(text) <= _CACHED_TEXT_MAX_LENGTH:
+            return self._cached_extract(text)
+        return self._extract_keywords(text)
+
+    def _extract_keywords(self, text: str) -> FrozenSet[str]:
+        """
+        Scan the text and collect its keywords; memoized by extract_set()
+        for headline-sized texts.
 
+        Args:
+            text: The non-empty text to extract keywords from.
+
+        Returns:
+            A frozenset of unique keywords, immutable so it can be cached.
+        """
         # Use a set to avoid duplicates
         keywords: Set[str] = set()
 
-        # Extract project names (case insensitive matching)
-        project_matches = self._project_pattern.findall(text)
+        project_matches, ticker_matches = self._scan(text)
+
+        # Handle project names (case insensitive matching)
+        project_map = CRYPTO_PROJECT_MAP
         for match in project_matches:
-            # Get the normalized (lowercase) project name
-            normalized_match = match.lower()
-            if normalized_match in CRYPTO_PROJECT_MAP:
-                # Add all associated tickers and names
-                keywords.update(CRYPTO_PROJECT_MAP[normalized_match])
-
-        # Extract tickers using regex
-        ticker_matches = self.ticker_regex.findall(text)
+            # Add all tickers and names associated with the lowercase name
+            associated = project_map.get(match.lower())
+            if associated is not None:
+                keywords.update(associated)
+
+        # Handle tickers, skipping unknown ones and common all-caps words;
+        # known tickers also add their associated project name
+        ticker_expansion = self._ticker_expansion
         for ticker in ticker_matches:
-            # Filter out common English words that happen to be all caps
-            if ticker not in TICKER_EXCLUSIONS:
-                # Check if it's a known ticker
-                if ticker in KNOWN_TICKERS:
-                    keywords.add(ticker)
-                    # Also add associated project name if available
-                    if ticker in TICKER_TO_PROJECT:
-                        keywords.update(TICKER_TO_PROJECT[ticker])
-
-        # Return sorted list for consistent output
-        return sorted(list(keywords))
-
-    def extract_tickers_only(self, text: str) -> List[str]:
+            expansion = ticker_expansion.get(ticker)
+            if expansion is not None:
+                keywords |= expansion
+
+        return frozenset(keywords)
+
+    def extract_batch(
+        self, texts: List[str], max_workers: Optional[int] = None
+    ) -> List[List[str]]:
+        """
+        Extract key entities from many texts in one call.
+
+        Texts are processed sequentially unless ``max_workers`` > 1 and the
+        batch reaches ``_PARALLEL_THRESHOLD``, in which case a thread pool is
+        used. Threads only overlap the native Hyperscan/Aho-Corasick scans and
+        free-threaded builds; on a GIL build the sequential path is usually
+        just as fast.
+
+        Args:
+            texts: The texts to extract keywords from.
+            max_workers: Max worker threads (sequential when None or 1).
+
+        Returns:
+            A list of keyword lists, one per input text, in input order.
+        """
+        if not texts:
+            return []
+
+        if max_workers is None or max_workers <= 1 or len(texts) < _PARALLEL_THRESHOLD:
+            extract = self.extract
+            return [extract(text) for text in texts]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(self.extract, texts))
+
+    def extract_tickers_only(self, text: Optional[str]) -> List[str]:
         """
         Extract only crypto tickers from the given text.
 
@@ -275,15 +748,20 @@ class KeywordExtractor:
 
         tickers: Set[str] = set()
 
-        # Extract tickers using regex
-        ticker_matches = self.ticker_regex.findall(text)
+        # Extract tickers, vectorized for long articles
+        if len(text) >= _VECTORIZED_TICKER_MIN_LENGTH:
+            ticker_matches = _find_uppercase_runs(text)
+        else:
+            ticker_matches = self.ticker_regex.findall(text)
+
+        ticker_expansion = self._ticker_expansion
         for ticker in ticker_matches:
-            if ticker not in TICKER_EXCLUSIONS and ticker in KNOWN_TICKERS:
+            if ticker in ticker_expansion:
                 tickers.add(ticker)
 
         return sorted(list(tickers))
 
-    def extract_projects_only(self, text: str) -> List[str]:
+    def extract_projects_only(self, text: Optional[str]) -> List[str]:
         """
         Extract only project names from the given text.
 
@@ -298,12 +776,43 @@ class KeywordExtractor:
 
         projects: Set[str] = set()
 
-        # Extract project names
-        project_matches = self._project_pattern.findall(text)
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            # Extract project names from the lowercased text
+            project_matches = self._project_pattern.findall(lowered)
+        else:
+            # Lowercasing changed the length (e.g. "İ"), which can move word
+            # boundaries, so fall back to the case-insensitive combined scan
+            project_matches = [match.lower() for match in self._scan_regex(text)[0]]
+
         for match in project_matches:
-            normalized_match = match.lower()
-            if normalized_match in CRYPTO_PROJECT_MAP:
+            if match in CRYPTO_PROJECT_MAP:
                 # Add project names (not tickers)
                 projects.add(match.capitalize())
 
         return sorted(list(projects))
+
+
+# Shared extractor for the module-level functions below, so the patterns and
+# scanners are compiled once per process instead of per KeywordExtractor()
+DEFAULT_EXTRACTOR = KeywordExtractor()
+
+
+def extract(text: Optional[str]) -> List[str]:
+    """Extract key entities from text using the default extractor."""
+    return DEFAULT_EXTRACTOR.extract(text)
+
+
+def extract_set(text: Optional[str]) -> FrozenSet[str]:
+    """Extract key entities as a frozenset using the default extractor."""
+    return DEFAULT_EXTRACTOR.extract_set(text)
+
+
+def extract_tickers_only(text: Optional[str]) -> List[str]:
+    """Extract only crypto tickers using the default extractor."""
+    return DEFAULT_EXTRACTOR.extract_tickers_only(text)
+
+
+def extract_projects_only(text: Optional[str]) -> List[str]:
+    """Extract only project names using the default extractor."""
+    return DEFAULT_EXTRACTOR.extract_projects_only(text)
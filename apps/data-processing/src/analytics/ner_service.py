@@ -15,8 +15,6 @@ from typing import Dict, List, Optional
 import spacy
 from spacy.language import Language
 
-from .keywords import CRYPTO_PROJECT_MAP, KNOWN_TICKERS
-
 logger = logging.getLogger(__name__)
 
 
@@ -30,11 +28,18 @@ class NERService:
     _TICKER_PATTERN = re.compile(r"(?:\$)?\b([A-Z]{2,6})\b")
 
     def __init__(self) -> None:
+        # keywords is imported lazily (here and below) so it is not loaded while
+        # the analytics package is initialising, which a mypyc-compiled build
+        # of that module cannot handle
+        from .keywords import KNOWN_TICKERS
+
         self._canonical_names = self._build_canonical_name_map()
         self._known_tickers = {ticker.upper() for ticker in KNOWN_TICKERS}
         self._nlp = self._initialize_pipeline()
 
     def _build_canonical_name_map(self) -> Dict[str, str]:
+        from .keywords import CRYPTO_PROJECT_MAP
+
         canonical_names: Dict[str, str] = {}
 
         for key, values in CRYPTO_PROJECT_MAP.items():
@@ -74,6 +79,8 @@ class NERService:
         else:
             ruler = nlp.add_pipe("entity_ruler", config=ruler_config)
 
+        from .keywords import CRYPTO_PROJECT_MAP
+
         patterns = []
 
         for project_name in CRYPTO_PROJECT_MAP:
@@ -10,7 +10,7 @@ from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 from dataclasses import dataclass
 
 # Import keyword extractor for asset filtering
-from src.analytics.keywords import KeywordExtractor
+from src.analytics.keywords import DEFAULT_EXTRACTOR, extract_tickers_only
 
 logger = logging.getLogger(__name__)
 
@@ -21,14 +21,14 @@ _PARALLEL_THRESHOLD = 20
 def _analyze_in_worker(args: Tuple[str, Optional[str]]) -> dict:
     """Process-safe sentiment analysis for a single text.
 
-    Each worker initialises its own VADER analyzer and KeywordExtractor
-    because they cannot be pickled across process boundaries.  Redis cache
-    is intentionally skipped in workers to avoid per-process connections.
+    Each worker initialises its own VADER analyzer because it cannot be
+    pickled across process boundaries; tickers come from the keywords
+    module's per-process default extractor.  Redis cache is intentionally
+    skipped in workers to avoid per-process connections.
     """
     text, asset_filter = args
 
-    extractor = KeywordExtractor()
-    asset_codes = extractor.extract_tickers_only(text)
+    asset_codes = extract_tickers_only(text)
 
     if asset_filter:
         asset_filter = asset_filter.upper()
@@ -98,7 +98,7 @@ class SentimentAnalyzer:
 
     def __init__(self):
         self.analyzer = SentimentIntensityAnalyzer()
-        self.keyword_extractor = KeywordExtractor()
+        self.keyword_extractor = DEFAULT_EXTRACTOR
         self.cache: object | None = None
         try:
             from cache_manager import CacheManager
@@ -1,6 +1,51 @@
 """Unit tests for the KeywordExtractor class."""
 
-from src.analytics.keywords import KeywordExtractor
+import re
+
+import pytest
+
+from src.analytics import keywords
+from src.analytics.keywords import (
+    TICKER_EXPANSION,
+    TICKER_PATTERN,
+    KeywordExtractor,
+    _find_uppercase_runs,
+    _trie_regex,
+)
+
+
+def assert_has(result, *expected):
+    """Assert that each expected keyword is in a list or set result."""
+    for keyword in expected:
+        assert keyword in result, f"{keyword!r} not found in {result!r}"
+
+
+@pytest.fixture(params=["hyperscan", "ahocorasick", "regex"])
+def backend_extractor(request, monkeypatch):
+    """Build an extractor pinned to each scanner whose package is installed."""
+    backend = request.param
+    if backend == "hyperscan":
+        pytest.importorskip("hyperscan")
+        monkeypatch.setattr(keywords, "HYPERSCAN_AVAILABLE", True)
+    else:
+        monkeypatch.setattr(keywords, "HYPERSCAN_AVAILABLE", False)
+        if backend == "ahocorasick":
+            pytest.importorskip("ahocorasick")
+            monkeypatch.setattr(keywords, "AHOCORASICK_AVAILABLE", True)
+        else:
+            monkeypatch.setattr(keywords, "AHOCORASICK_AVAILABLE", False)
+    extractor = KeywordExtractor()
+
+    assert (extractor._hyperscan_db is not None) == (backend == "hyperscan")
+    assert (extractor._automaton is not None) == (backend == "ahocorasick")
+    return extractor
+
+
+def regex_extractor(monkeypatch):
+    """Build an extractor that only uses the combined regex fallback."""
+    monkeypatch.setattr(keywords, "HYPERSCAN_AVAILABLE", False)
+    monkeypatch.setattr(keywords, "AHOCORASICK_AVAILABLE", False)
+    return KeywordExtractor()
 
 
 def test_extract_xlm_from_stellar_headline():
@@ -120,8 +165,17 @@ def test_extract_duplicate_keywords():
 
     assert isinstance(result, list)
     # Should have only unique keywords
-    assert result.count("BTC") == 1
-    assert result.count("Bitcoin") == 1
+    assert len(result) == len(set(result))
+    assert_has(result, "BTC", "Bitcoin")
+
+
+def test_extract_set_duplicate_keywords():
+    """Test that repeated mentions collapse into one set entry each."""
+    extractor = KeywordExtractor()
+    result = extractor.extract_set("Bitcoin Bitcoin BTC BTC")
+
+    assert_has(result, "BTC", "Bitcoin")
+    assert result == {"BTC", "Bitcoin"}
 
 
 def test_extract_tickers_only():
@@ -245,3 +299,154 @@ def test_real_headline_extraction():
         assert isinstance(result, list)
         # Each headline should have at least one keyword
         assert len(result) > 0, f"No keywords extracted from: {headline}"
+
+
+def test_extract_prefers_longest_project_name(backend_extractor):
+    """Test that a multi-word project name wins over its shorter prefix."""
+    text = "The Stellar Development Foundation announced new grants"
+    result = backend_extractor.extract(text)
+
+    assert result == ["SDF", "Stellar"]
+
+
+def test_extract_respects_word_boundaries(backend_extractor):
+    """Test that keywords embedded in longer words are not matched."""
+    text = "Interstellar solar BTCX adoption"
+    result = backend_extractor.extract(text)
+
+    assert result == []
+
+
+def test_extract_matches_regex_fallback(backend_extractor, monkeypatch):
+    """Test that the multi-pattern scanners and regex fallback agree."""
+    text = (
+        "Stellar Development Foundation, SOROBAN and xlm: BTC/ETH rally while "
+        "the DOT and Chainlink (LINK) lag; USD Coin supply_BTC grows"
+    )
+    fallback = regex_extractor(monkeypatch)
+
+    assert backend_extractor.extract(text) == fallback.extract(text)
+
+
+def test_regex_fallback_treats_uppercase_project_as_ticker(monkeypatch):
+    """Test that the combined regex still expands tickers spelled like projects."""
+    extractor = regex_extractor(monkeypatch)
+    result = extractor.extract("XRP volume climbs")
+
+    assert result == ["Ripple", "XRP"]
+
+
+def test_extract_rejects_non_ascii_word_neighbours(backend_extractor):
+    """Test that letters such as "é" still count as word characters."""
+    result = backend_extractor.extract("ÉBTC and Stellaré are not tickers or projects")
+
+    assert result == []
+
+
+def test_automaton_falls_back_when_lowercasing_changes_length(monkeypatch):
+    """Test that text whose lowercase form changes length is rescanned by regex."""
+    pytest.importorskip("ahocorasick")
+    monkeypatch.setattr(keywords, "HYPERSCAN_AVAILABLE", False)
+    monkeypatch.setattr(keywords, "AHOCORASICK_AVAILABLE", True)
+    extractor = KeywordExtractor()
+    text = "İstanbul exchange lists Bitcoin and XLM"
+
+    assert len(text.lower()) != len(text)
+    assert extractor.extract(text) == ["BTC", "Bitcoin", "Stellar", "XLM"]
+    assert extractor.extract(text) == regex_extractor(monkeypatch).extract(text)
+
+
+def test_extract_batch_preserves_order(backend_extractor):
+    """Test that batch extraction matches per-text extraction in order."""
+    texts = ["Bitcoin rallies", "", "Soroban goes live", "Nothing here"] * 10
+    expected = [backend_extractor.extract(t) for t in texts]
+
+    assert backend_extractor.extract_batch(texts) == expected
+    assert backend_extractor.extract_batch(texts, max_workers=4) == expected
+
+
+def test_extract_returns_fresh_list_for_cached_text():
+    """Test that mutating a result does not affect later cached results."""
+    extractor = KeywordExtractor()
+    text = "Bitcoin and Ethereum rally"
+    first = extractor.extract(text)
+    first.append("Mutated")
+
+    assert extractor.extract(text) == ["BTC", "Bitcoin", "ETH", "Ethereum"]
+
+
+def test_extract_does_not_cache_long_texts():
+    """Test that only headline-sized texts are memoized."""
+    extractor = KeywordExtractor()
+    extractor.extract("Bitcoin and Ethereum rally")
+    currsize = extractor._cached_extract.cache_info().currsize
+    text = "Markets were quiet today. " * 50 + "Bitcoin rallied."
+
+    assert extractor.extract(text) == ["BTC", "Bitcoin"]
+    assert extractor._cached_extract.cache_info().currsize == currsize == 1
+
+
+def test_extract_skips_text_without_keyword_characters():
+    """Test that texts with no possible keyword start are rejected early."""
+    extractor = KeywordExtractor()
+
+    assert extractor.extract("12345 +++ 日本語のニュース 67.8%") == []
+    assert extractor.extract("日本語 Bitcoin") == ["BTC", "Bitcoin"]
+
+
+def test_trie_regex_shares_prefixes_longest_first():
+    """Test that the project trie regex shares prefixes and prefers longer names."""
+    pattern = _trie_regex(["sol", "solana", "stellar"])
+
+    assert pattern == "s(?:ol(?:ana)?|tellar)"
+    assert [m.group() for m in re.finditer(pattern, "solana sol stellar")] == [
+        "solana",
+        "sol",
+        "stellar",
+    ]
+
+
+def test_extract_set_returns_unsorted_frozenset():
+    """Test that extract_set returns the same keywords as an immutable set."""
+    extractor = KeywordExtractor()
+    text = "Stellar (XLM) and Bitcoin (BTC) show growth"
+    result = extractor.extract_set(text)
+
+    assert isinstance(result, frozenset)
+    assert result == {"XLM", "Stellar", "BTC", "Bitcoin"}
+    assert sorted(result) == extractor.extract(text)
+    assert extractor.extract_set(None) == frozenset()
+
+
+def test_find_uppercase_runs_matches_ticker_regex():
+    """Test that the vectorized run finder agrees with the ticker regex."""
+    text = "XLM éBTC ETH_ SOLANA AB ABCDEF x(DOGE) 2LINK ÉUSDC MATIC. " * 50
+
+    assert _find_uppercase_runs(text) == re.findall(TICKER_PATTERN, text)
+
+
+def test_extract_tickers_only_long_article():
+    """Test ticker extraction on article-length text."""
+    extractor = KeywordExtractor()
+    text = "Markets were quiet today. " * 400 + "XLM and BTC rallied; THE end."
+    result = extractor.extract_tickers_only(text)
+
+    assert result == ["BTC", "XLM"]
+
+
+def test_module_functions_use_default_extractor():
+    """Test that module-level helpers match a dedicated extractor."""
+    extractor = KeywordExtractor()
+    text = "Stellar (XLM) and Bitcoin (BTC) show growth"
+
+    assert keywords.extract(text) == extractor.extract(text)
+    assert keywords.extract_set(text) == extractor.extract_set(text)
+    assert keywords.extract_tickers_only(text) == ["BTC", "XLM"]
+    assert keywords.extract_projects_only(text) == extractor.extract_projects_only(text)
+
+
+def test_ticker_expansion_table():
+    """Test the precomputed single-probe ticker table."""
+    assert TICKER_EXPANSION["XLM"] == {"XLM", "Stellar"}
+    assert TICKER_EXPANSION["SDF"] == {"SDF"}
+    assert "THE" not in TICKER_EXPANSION